@@ -7,42 +7,99 @@ formats them, and pushes the details to a Telegram chat via the Bot API.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
 import json
 import logging
 import os
+import re
+import signal
 import time
 import html
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence, Set
+from typing import Any, AsyncIterator, Dict, Iterable, List, Sequence, Set, Tuple
 
+import aiohttp
 import requests
+import urllib3
 from dotenv import load_dotenv
+from eth_utils import to_int
+from eth_utils.abi import collapse_if_tuple
 from hexbytes import HexBytes
-from web3 import Web3
-from web3.contract import Contract
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncWeb3, Web3, WebsocketProviderV2
+from web3._utils.events import get_event_data
+from web3.contract import AsyncContract
 from web3.types import EventData
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
 
 load_dotenv()
 
 DEFAULT_RPC_URL = "https://rpc.gnosischain.com"
 DEFAULT_CONFIRMATIONS = 3
 DEFAULT_POLL_INTERVAL = 15
+MAX_POLL_INTERVAL = 60.0
+# Gnosis seals a block every ~5s; a minute of silence means the socket stalled.
+WS_HEAD_TIMEOUT = 60.0
 DEFAULT_BATCH_SIZE = 200
+TARGET_LOGS_PER_REQUEST = 500
+LOG_LIMIT_ERROR_MARKERS = ("more than", "exceed", "block range", "range too")
+RATE_LIMIT_ERROR_MARKERS = ("rate limit", "too many requests")
+RPC_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RPC_RETRY_ATTEMPTS = 4
+RPC_RETRY_BASE_DELAY = 1.0
+BATCH_RECOVERY_STREAK = 10
+BATCH_RECOVERY_STEP = 50
+BLOCK_FAILURE_LIMIT = 5
+_HEX_PREFIX = ("0x", "0X")
+_HEX_DIGITS = re.compile(r"[0-9a-fA-F]+")
 MAX_MESSAGE_LENGTH = 3900
 STATE_FILE = Path("state.json")
+STATE_FLUSH_BLOCKS = 100
+STATE_FLUSH_INTERVAL = 30.0
+SEEN_TX_CAP = 10_000
+ITEM_MAP_CAP = 5_000
+NOTIFY_QUEUE_SIZE = 256
+TELEGRAM_MIN_INTERVAL = 1 / 30.0
+TELEGRAM_MAX_RETRIES = 5
 ABI_FILE = Path("abi.json")
 REGISTRY_ADDRESS = "0x5aaf9e23a11440f8c1ad6d2e2e5109c7e52cc672"
-EXPLORER_TX_URL = os.getenv("EXPLORER_TX_URL", "https://gnosisscan.io/tx/")
+CURATE_TCR_URL = "https://curate.kleros.io/tcr/100"
 IPFS_GATEWAY = os.getenv("IPFS_GATEWAY", "https://ipfs.io")
+_IPFS_GATEWAY_ROOT = IPFS_GATEWAY.rstrip("/")
 IPFS_TIMEOUT = int(os.getenv("IPFS_TIMEOUT", "20"))
 SUBGRAPH_URL = os.getenv("SUBGRAPH_URL")
+MARKET_CACHE_FILE = Path("market_cache.json")
+MARKET_CACHE_FLUSH_WRITES = 50
+_NOTIFY_EVENTS = frozenset({"NewItem", "RequestSubmitted"})
+_HANDLED_EVENTS = _NOTIFY_EVENTS | {"Dispute"}
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
 
 
 @dataclass
 class Settings:
     rpc_url: str
+    ws_url: str | None
     telegram_token: str
     telegram_chat_id: str
     confirmations: int
@@ -52,6 +109,80 @@ class Settings:
     start_block: int | None
 
 
+@dataclass
+class BatchSizer:
+    """Steers the eth_getLogs block span toward TARGET_LOGS_PER_REQUEST logs.
+
+    The configured ``size`` is also the hard upper bound, since operators pick
+    it to stay inside their provider's range limit.
+    """
+
+    size: int
+    logs_per_block: float | None = None
+    limit: int = field(init=False)
+    ceiling: int = field(init=False)
+    clean_batches: int = 0
+
+    def __post_init__(self) -> None:
+        self.limit = self.ceiling = self.size
+
+    def shrink(self, failed_span: int) -> None:
+        """Halve the allowed span after the provider choked on ``failed_span``."""
+        self.ceiling = max(failed_span // 2, 1)
+        self.size = min(self.size, self.ceiling)
+        self.clean_batches = 0
+
+    def record(self, block_span: int, log_count: int) -> None:
+        density = log_count / max(block_span, 1)
+        if self.logs_per_block is None:
+            self.logs_per_block = density
+        else:
+            self.logs_per_block = 0.8 * self.logs_per_block + 0.2 * density
+        if self.logs_per_block > 0:
+            ideal = int(TARGET_LOGS_PER_REQUEST / self.logs_per_block)
+        else:
+            ideal = self.limit
+        # Move at most a factor of two per batch so one outlier can't swing it.
+        ideal = min(max(ideal, self.size // 2), self.size * 2)
+        # After a failure the ceiling climbs back additively, one step per
+        # streak of clean batches, so a degraded node isn't hammered again.
+        self.clean_batches += 1
+        if self.clean_batches >= BATCH_RECOVERY_STREAK:
+            self.ceiling = min(self.ceiling + BATCH_RECOVERY_STEP, self.limit)
+            self.clean_batches = 0
+        self.size = min(max(ideal, 1), self.ceiling)
+
+
+@dataclass
+class PollPacer:
+    """Shortens the head poll delay while events flow and backs off when idle."""
+
+    interval: int
+    active: bool = False
+    idle_rounds: int = 0
+
+    def record(self, event_count: int) -> None:
+        self.active = event_count > 0
+        self.idle_rounds = 0 if self.active else self.idle_rounds + 1
+
+    @property
+    def delay(self) -> float:
+        if self.active:
+            return max(1, self.interval // 2)
+        # Never back off below the configured interval, even if it exceeds the cap.
+        cap = max(self.interval, MAX_POLL_INTERVAL)
+        return min(self.interval * (1 + self.idle_rounds * 0.5), cap)
+
+
+@dataclass
+class Notification:
+    message: str
+    event_name: str
+    block_number: int
+    tx_hash: str
+    tx_key: bytes | None
+
+
 @dataclass
 class MarketDetails:
     address: str | None
@@ -68,6 +199,7 @@ def load_settings() -> Settings:
         raise ValueError("TELEGRAM_CHAT_ID environment variable is required.")
 
     rpc_url = os.getenv("GNOSIS_RPC_URL", DEFAULT_RPC_URL)
+    ws_url = os.getenv("GNOSIS_WS_URL") or None
     confirmations = int(os.getenv("CONFIRMATIONS", DEFAULT_CONFIRMATIONS))
     poll_interval = int(os.getenv("POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
     batch_size = int(os.getenv("BATCH_SIZE", DEFAULT_BATCH_SIZE))
@@ -77,6 +209,7 @@ def load_settings() -> Settings:
 
     return Settings(
         rpc_url=rpc_url,
+        ws_url=ws_url,
         telegram_token=telegram_token,
         telegram_chat_id=telegram_chat_id,
         confirmations=max(confirmations, 0),
@@ -87,15 +220,28 @@ def load_settings() -> Settings:
     )
 
 
-def build_contract(settings: Settings) -> Contract:
+async def build_contract(
+    settings: Settings, session: aiohttp.ClientSession
+) -> AsyncContract:
     if not ABI_FILE.exists():
         raise FileNotFoundError(f"Missing ABI file at {ABI_FILE}")
 
-    with ABI_FILE.open("r", encoding="utf-8") as abi_file:
-        abi = json.load(abi_file)
+    # Only events are ever decoded; dropping the function entries keeps the
+    # contract object small. MARKET_NAME_ABI covers the one call we make.
+    abi = [
+        entry
+        for entry in json_loads(ABI_FILE.read_bytes())
+        if entry.get("type") == "event"
+    ]
 
-    w3 = Web3(Web3.HTTPProvider(settings.rpc_url, request_kwargs={"timeout": 60}))
-    if not w3.is_connected():
+    provider = AsyncWeb3.AsyncHTTPProvider(
+        settings.rpc_url,
+        request_kwargs={"timeout": aiohttp.ClientTimeout(total=60)},
+    )
+    # Pin our own session so every RPC reuses the same pooled connections.
+    await provider.cache_async_session(session)
+    w3 = AsyncWeb3(provider)
+    if not await w3.is_connected():
         raise ConnectionError(f"Unable to connect to GNOSIS RPC at {settings.rpc_url}")
 
     checksum_address = Web3.to_checksum_address(settings.registry_address)
@@ -111,42 +257,242 @@ def load_last_processed_block(default: int) -> int:
         return default
 
     try:
-        with STATE_FILE.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        with STATE_FILE.open("rb") as handle:
+            data = json_loads(handle.read())
         return int(data.get("last_processed_block", default))
-    except (ValueError, json.JSONDecodeError):
+    except ValueError:
         logging.warning("State file corrupted, defaulting to %s", default)
         return default
 
 
+def load_seen_transactions() -> None:
+    if not STATE_FILE.exists():
+        return
+
+    try:
+        with STATE_FILE.open("rb") as handle:
+            data = json_loads(handle.read())
+        seen = data.get("seen_transactions", {})
+        if isinstance(seen, list):
+            # Older state files kept bare hashes; pin them just past the
+            # checkpoint so they are dropped once it moves on.
+            after_checkpoint = int(data.get("last_processed_block", 0)) + 1
+            seen = dict.fromkeys(seen, after_checkpoint)
+        for tx_hash, block_number in seen.items():
+            remember_transaction(bytes(HexBytes(tx_hash)), int(block_number))
+    except (TypeError, ValueError):
+        logging.warning("State file corrupted, starting with no seen transactions")
+
+
+_dirty_block: int | None = None
+_last_flushed_block: int | None = None
+_last_flush_time = 0.0
+# Insertion-ordered so the oldest hashes are evicted first once the cap is hit;
+# each maps to its block so only hashes a restart could replay are persisted.
+_seen_transactions: OrderedDict[bytes, int] = OrderedDict()
+
+
+def remember_transaction(tx_hash: bytes, block_number: int) -> None:
+    _seen_transactions[tx_hash] = block_number
+    _seen_transactions.move_to_end(tx_hash)
+    while len(_seen_transactions) > SEEN_TX_CAP:
+        _seen_transactions.popitem(last=False)
+
+
+def remember_item(mapping: OrderedDict[Any, str], key: Any, item_id: str) -> None:
+    mapping[key] = item_id
+    mapping.move_to_end(key)
+    while len(mapping) > ITEM_MAP_CAP:
+        mapping.popitem(last=False)
+
+
+def set_checkpoint_baseline(block_number: int) -> None:
+    """Note the block a restart would resume from before anything is flushed."""
+    global _last_flushed_block
+    _last_flushed_block = block_number
+
+
 def save_last_processed_block(block_number: int) -> None:
-    STATE_FILE.write_text(
-        json.dumps({"last_processed_block": block_number}, indent=2),
-        encoding="utf-8",
-    )
+    """Record progress in memory, writing it out every few blocks or seconds."""
+    global _dirty_block
+    _dirty_block = block_number
+    if (
+        _last_flushed_block is None
+        or abs(block_number - _last_flushed_block) >= STATE_FLUSH_BLOCKS
+        or time.monotonic() - _last_flush_time >= STATE_FLUSH_INTERVAL
+    ):
+        flush_last_processed_block()
+
+
+def flush_last_processed_block() -> None:
+    global _dirty_block, _last_flushed_block, _last_flush_time
+    if _dirty_block is None:
+        return
+    _last_flushed_block = _dirty_block
+    write_state()
+    _last_flush_time = time.monotonic()
+    _dirty_block = None
+
+
+def write_state() -> None:
+    """Write the on-disk checkpoint plus every delivery a restart would replay.
+
+    Also called after each delivery, without moving the checkpoint, so a crash
+    between checkpoints doesn't re-send what was already delivered.
+    """
+    state: Dict[str, Any] = {}
+    checkpoint = _last_flushed_block
+    if checkpoint is not None:
+        state["last_processed_block"] = checkpoint
+    state["seen_transactions"] = {
+        "0x" + bytes.hex(tx_hash): block_number
+        for tx_hash, block_number in _seen_transactions.items()
+        if checkpoint is None or block_number > checkpoint
+    }
+    tmp_file = STATE_FILE.with_name(f"{STATE_FILE.name}.tmp")
+    tmp_file.write_bytes(json_dumps(state))
+    os.replace(tmp_file, STATE_FILE)
 
 
-def get_event_classes(contract: Contract) -> Sequence[Any]:
-    event_names: List[str] = [
-        entry["name"] for entry in contract.abi if entry.get("type") == "event"
-    ]
-    return [getattr(contract.events, name) for name in event_names]
+atexit.register(flush_last_processed_block)
+
+
+def get_event_classes(
+    contract: AsyncContract,
+) -> Tuple[Tuple[str, HexBytes, Dict[str, Any]], ...]:
+    """Return ``(name, topic0, abi)`` for every non-anonymous event in the ABI.
+
+    Built once at startup; the result is a tuple because nothing extends it.
+    Logs are decoded straight from the ABI, so web3's ``contract.events``
+    accessors are never needed.
+    """
+    event_classes: List[Tuple[str, HexBytes, Dict[str, Any]]] = []
+    for entry in contract.abi:
+        if entry.get("type") != "event" or entry.get("anonymous"):
+            continue
+        input_types = ",".join(collapse_if_tuple(item) for item in entry["inputs"])
+        topic0 = HexBytes(Web3.keccak(text=f"{entry['name']}({input_types})"))
+        event_classes.append((entry["name"], topic0, entry))
+    return tuple(event_classes)
+
 
+def build_topic_map(
+    event_classes: Sequence[Tuple[str, HexBytes, Dict[str, Any]]],
+) -> Dict[HexBytes, Dict[str, Any]]:
+    return {topic0: event_abi for _, topic0, event_abi in event_classes}
 
-def poll_for_events(
-    contract: Contract,
-    event_classes: Sequence[Any],
+
+def is_rate_limit_message(message: str) -> bool:
+    return any(marker in message for marker in RATE_LIMIT_ERROR_MARKERS)
+
+
+def is_log_limit_error(exc: Exception) -> bool:
+    """True when the provider refused the range as too large."""
+    message = str(exc).lower()
+    # "rate limit exceeded" also contains "exceed" but says nothing about size.
+    if is_rate_limit_message(message):
+        return False
+    return any(marker in message for marker in LOG_LIMIT_ERROR_MARKERS)
+
+
+def is_transient_rpc_error(exc: Exception) -> bool:
+    """True when the same request is worth repeating after a pause."""
+    if isinstance(exc, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+        return True
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in RPC_RETRY_STATUSES
+    return is_rate_limit_message(str(exc).lower())
+
+
+async def fetch_logs(
+    contract: AsyncContract,
+    topic_map: Dict[HexBytes, Dict[str, Any]],
     from_block: int,
     to_block: int,
+) -> List[Any]:
+    """Run eth_getLogs, backing off on timeouts and rate limits.
+
+    Raises once RPC_RETRY_ATTEMPTS are used up, or straight away for any
+    other error, so a failed range is never mistaken for an empty one.
+    """
+    attempt = 1
+    while True:
+        try:
+            return await contract.w3.eth.get_logs(
+                {
+                    "address": contract.address,
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [list(topic_map)],
+                }
+            )
+        except Exception as exc:  # noqa: BLE001
+            if attempt >= RPC_RETRY_ATTEMPTS or not is_transient_rpc_error(exc):
+                raise
+            delay = RPC_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            logging.warning(
+                "eth_getLogs for blocks %s-%s failed (%s); retry %d/%d in %.0fs",
+                from_block,
+                to_block,
+                exc,
+                attempt,
+                RPC_RETRY_ATTEMPTS - 1,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+async def poll_for_events(
+    contract: AsyncContract,
+    topic_map: Dict[HexBytes, Dict[str, Any]],
+    from_block: int,
+    to_block: int,
+    sizer: BatchSizer | None = None,
 ) -> List[EventData]:
+    try:
+        logs = await fetch_logs(contract, topic_map, from_block, to_block)
+    except Exception as exc:  # noqa: BLE001
+        # Only "too many results" gets smaller by splitting; anything else has
+        # already been retried and must reach the caller, not become [].
+        if from_block < to_block and is_log_limit_error(exc):
+            if sizer is not None:
+                sizer.shrink(to_block - from_block + 1)
+            mid = (from_block + to_block) // 2
+            logging.info(
+                "Provider rejected blocks %s-%s (%s); splitting at %s",
+                from_block,
+                to_block,
+                exc,
+                mid,
+            )
+            first = await poll_for_events(
+                contract, topic_map, from_block, mid, sizer
+            )
+            second = await poll_for_events(
+                contract, topic_map, mid + 1, to_block, sizer
+            )
+            return first + second
+        raise
+
     collected: List[EventData] = []
-    for event_cls in event_classes:
+    for log in logs:
+        topics = log.get("topics") or []
+        event_abi = topic_map.get(HexBytes(topics[0])) if topics else None
+        if event_abi is None:
+            continue
         try:
-            logs = event_cls.get_logs(fromBlock=from_block, toBlock=to_block)
+            collected.append(get_event_data(contract.w3.codec, event_abi, log))
         except Exception as exc:  # noqa: BLE001
-            logging.exception("Failed to fetch %s events: %s", event_cls.event_name, exc)
-            continue
-        collected.extend(logs)
+            # One undecodable log shouldn't fail the range and hold back
+            # every other event in it.
+            logging.error(
+                "Skipping undecodable log %s in block %s (tx=%s): %s",
+                log.get("logIndex"),
+                log.get("blockNumber"),
+                normalise_value(log.get("transactionHash")),
+                exc,
+            )
 
     collected.sort(
         key=lambda entry: (
@@ -158,47 +504,107 @@ def poll_for_events(
     return collected
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_checksum(hex_str: str) -> str:
+    return Web3.to_checksum_address(hex_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_bytes_checksum(bytes_value: bytes) -> str:
+    return Web3.to_checksum_address("0x" + bytes.hex(bytes_value))
+
+
 def try_checksum_address(value: Any) -> str | None:
     if isinstance(value, str):
         candidate = value.strip()
         if not candidate:
             return None
-        prefixed = candidate if candidate.startswith(("0x", "0X")) else f"0x{candidate}"
+        prefixed = candidate if candidate.startswith(_HEX_PREFIX) else f"0x{candidate}"
         if Web3.is_address(prefixed):
-            return Web3.to_checksum_address(prefixed)
+            return _cached_checksum(prefixed.lower())
         return None
     if isinstance(value, (bytes, bytearray, HexBytes)):
         if len(value) == 20:
-            hex_value = Web3.to_hex(value)
-            return Web3.to_checksum_address(hex_value)
+            return _cached_bytes_checksum(bytes(value))
     return None
 
 
+@functools.singledispatch
 def normalise_value(value: Any) -> str:
-    checksum = try_checksum_address(value)
-    if checksum is not None:
-        return checksum
-    if isinstance(value, HexBytes):
-        return value.hex()
-    if isinstance(value, bytes):
-        return value.hex()
-    if isinstance(value, (list, tuple)):
-        return "[" + ", ".join(normalise_value(item) for item in value) + "]"
+    """Render an event argument for logs, checksumming anything address-like."""
     return str(value)
 
 
-def format_event(event: EventData) -> str:
-    args_lines = [
-        f"• {key}: {normalise_value(value)}" for key, value in event["args"].items()
-    ]
-    explorer_url = f"{EXPLORER_TX_URL.rstrip('/')}/{event['transactionHash'].hex()}"
-    body = "\n".join(args_lines) if args_lines else "• (no arguments)"
-    return (
-        f"Event: {event['event']}\n"
-        f"Block: {event['blockNumber']}\n"
-        f"Transaction: {explorer_url}\n"
-        f"{body}"
+@normalise_value.register(int)
+def _normalise_int(value: int) -> str:
+    return str(value)
+
+
+@normalise_value.register(str)
+def _normalise_str(value: str) -> str:
+    checksum = try_checksum_address(value)
+    return checksum if checksum is not None else value
+
+
+@normalise_value.register(bytes)
+def _normalise_bytes(value: bytes) -> str:
+    if len(value) == 20:
+        return _cached_bytes_checksum(value)
+    # bytes.hex skips HexBytes' own override, which already adds a 0x prefix.
+    return "0x" + bytes.hex(value)
+
+
+@normalise_value.register(bytearray)
+def _normalise_bytearray(value: bytearray) -> str:
+    return _normalise_bytes(bytes(value))
+
+
+@normalise_value.register(list)
+@normalise_value.register(tuple)
+def _normalise_sequence(value: list | tuple) -> str:
+    return "[" + ", ".join(map(normalise_value, value)) + "]"
+
+
+def build_http_session(*, retry_post: bool = False) -> requests.Session:
+    """Keep-alive session so repeated calls to one host reuse its connection.
+
+    urllib3 only retries idempotent methods on a bad status, so POST has to be
+    opted in, and only for requests that are safe to send twice.
+    """
+    allowed_methods = Retry.DEFAULT_ALLOWED_METHODS
+    if retry_post:
+        allowed_methods = allowed_methods | {"POST"}
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=allowed_methods,
+            raise_on_status=False,
+        ),
     )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One session per upstream so pooled connections never cross hosts.
+_IPFS_SESSION = build_http_session()
+# Subgraph POSTs are read-only GraphQL queries, so retrying them is harmless.
+_SUBGRAPH_SESSION = build_http_session(retry_post=True)
+# Telegram is hit once per notification, so it talks to urllib3 directly and
+# skips building a requests PreparedRequest for every message. Only connection
+# failures are retried here: resending a sendMessage that may have been read
+# could post it twice, and 429s are paced by deliver_notification instead.
+_TG_POOL = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=16,
+    retries=Retry(total=3, backoff_factor=0.3, raise_on_status=False),
+)
+_TG_HEADERS = {"Content-Type": "application/json"}
 
 
 class TelegramSendError(RuntimeError):
@@ -229,16 +635,15 @@ def send_telegram_message(
         payload["parse_mode"] = parse_mode
     if disable_preview is not None:
         payload["disable_web_page_preview"] = disable_preview
-    response = requests.post(
-        url,
-        json=payload,
-        timeout=30,
+    response = _TG_POOL.request(
+        "POST", url, body=json_dumps(payload), headers=_TG_HEADERS, timeout=30
     )
+    ok = 200 <= response.status < 300
     migrate_to: int | None = None
     retry_after: int | None = None
     description: str | None = None
     try:
-        response_json = response.json()
+        response_json = json_loads(response.data)
     except ValueError:
         response_json = None
 
@@ -248,18 +653,36 @@ def send_telegram_message(
             migrate_to = params.get("migrate_to_chat_id")
             retry_after = params.get("retry_after")
             description = response_json.get("description")
-    elif not response.ok:
-        description = response.text
+    elif not ok:
+        description = response.data.decode("utf-8", "replace")
 
-    if description or not response.ok:
+    if description or not ok:
         raise TelegramSendError(
-            f"Telegram API error ({response.status_code}): {description or response.text}",
+            f"Telegram API error ({response.status}): "
+            f"{description or response.data.decode('utf-8', 'replace')}",
             migrate_to_chat_id=migrate_to,
             retry_after=retry_after,
         )
 
 
-def deliver_notification(
+class RateLimiter:
+    """Spaces out calls so at most one starts every ``min_interval`` seconds."""
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self.last_sent = float("-inf")
+
+    async def acquire(self) -> None:
+        delay = self.last_sent + self.min_interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.last_sent = time.monotonic()
+
+
+_TG_RATE_LIMITER = RateLimiter(TELEGRAM_MIN_INTERVAL)
+
+
+async def deliver_notification(
     token: str,
     chat_id: str,
     message: str,
@@ -268,9 +691,12 @@ def deliver_notification(
     disable_preview: bool | None = None,
 ) -> str:
     current_chat_id = chat_id
+    retries = 0
     while True:
+        await _TG_RATE_LIMITER.acquire()
         try:
-            send_telegram_message(
+            await asyncio.to_thread(
+                send_telegram_message,
                 token,
                 current_chat_id,
                 message,
@@ -287,11 +713,54 @@ def deliver_notification(
                     )
                     current_chat_id = migrated_id
                     continue
+            if err.retry_after is not None and retries < TELEGRAM_MAX_RETRIES:
+                retries += 1
+                logging.warning(
+                    "Telegram rate limit hit; retrying in %ss", err.retry_after
+                )
+                await asyncio.sleep(err.retry_after + 0.2)
+                continue
             raise
 
 
-def determine_initial_block(contract: Contract, settings: Settings) -> int:
-    latest = contract.web3.eth.block_number
+async def notifier_worker(
+    settings: Settings, queue: asyncio.Queue[Notification | int]
+) -> None:
+    """Deliver queued messages so Telegram latency doesn't stall log fetching.
+
+    A bare ``int`` in the queue marks the end of a batch: everything queued
+    before it has been handled, so progress up to that block is persisted.
+    """
+    while True:
+        item = await queue.get()
+        try:
+            if isinstance(item, int):
+                save_last_processed_block(item)
+                continue
+            settings.telegram_chat_id = await deliver_notification(
+                settings.telegram_token,
+                settings.telegram_chat_id,
+                item.message,
+                parse_mode="HTML",
+                disable_preview=False,
+            )
+            logging.info(
+                "Sent notification for %s (block %s) | tx=%s",
+                item.event_name,
+                item.block_number,
+                item.tx_hash,
+            )
+            if item.tx_key is not None:
+                remember_transaction(item.tx_key, item.block_number)
+                write_state()
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("Failed to send notification: %s", exc)
+        finally:
+            queue.task_done()
+
+
+async def determine_initial_block(contract: AsyncContract, settings: Settings) -> int:
+    latest = await contract.web3.eth.block_number
     confirmed = max(latest - settings.confirmations, 0)
     if settings.start_block is not None:
         start = max(settings.start_block, 0)
@@ -302,10 +771,55 @@ def determine_initial_block(contract: Contract, settings: Settings) -> int:
     return state_last
 
 
-def split_batches(start: int, end: int, size: int) -> Iterable[tuple[int, int]]:
+async def poll_chain_heads(w3: AsyncWeb3, pacer: PollPacer) -> AsyncIterator[int]:
+    while True:
+        yield await w3.eth.block_number
+        # Read the delay after the consumer has recorded this round's work.
+        await asyncio.sleep(pacer.delay)
+
+
+async def subscribe_chain_heads(ws_url: str) -> AsyncIterator[int]:
+    async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(ws_url)) as ws_w3:
+        await ws_w3.eth.subscribe("newHeads")
+        messages = ws_w3.ws.process_subscriptions()
+        while True:
+            # A socket can stay open yet stop delivering; the TimeoutError
+            # sends iter_chain_heads back to polling instead of hanging.
+            message = await asyncio.wait_for(anext(messages), WS_HEAD_TIMEOUT)
+            number = message["result"]["number"]
+            # web3 only decodes the header if it recognises it as a block.
+            yield to_int(hexstr=number) if isinstance(number, str) else int(number)
+
+
+async def iter_chain_heads(
+    settings: Settings, w3: AsyncWeb3, pacer: PollPacer
+) -> AsyncIterator[int]:
+    """Yield the latest block number whenever the chain head may have moved.
+
+    Uses a ``newHeads`` websocket subscription when ``GNOSIS_WS_URL`` is set,
+    falling back to polling ``eth_blockNumber`` over HTTP if it is unavailable.
+    """
+    if settings.ws_url:
+        try:
+            async for head in subscribe_chain_heads(settings.ws_url):
+                yield head
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(
+                "newHeads subscription on %s failed, falling back to polling: %r",
+                settings.ws_url,
+                exc,
+            )
+    async for head in poll_chain_heads(w3, pacer):
+        yield head
+
+
+def split_batches(
+    start: int, end: int, sizer: BatchSizer
+) -> Iterable[tuple[int, int]]:
     cursor = start
     while cursor <= end:
-        batch_end = min(cursor + size - 1, end)
+        # Read the size lazily so adjustments apply to the very next batch.
+        batch_end = min(cursor + sizer.size - 1, end)
         yield cursor, batch_end
         cursor = batch_end + 1
 
@@ -322,90 +836,94 @@ def extract_item_id(args: Dict[str, Any]) -> str | None:
     raw = args.get("_itemID") or args.get("itemID")
     if raw is None:
         return None
-    if isinstance(raw, HexBytes):
-        return Web3.to_hex(raw).lower()
     if isinstance(raw, bytes):
-        return Web3.to_hex(raw).lower()
+        # bytes.hex is already lowercase; calling it unbound also sidesteps
+        # HexBytes.hex, whose 0x prefix differs between hexbytes releases.
+        return "0x" + bytes.hex(raw)
+    if isinstance(raw, bytearray):
+        return "0x" + raw.hex()
     if isinstance(raw, int):
         return hex(raw).lower()
     if isinstance(raw, str):
         raw_str = raw.strip()
-        if raw_str.startswith("0x"):
+        if raw_str[:2] in _HEX_PREFIX:
             return raw_str.lower()
-        try:
-            return hex(int(raw_str, 0)).lower()
-        except ValueError:
-            # Fallback: treat as hex without prefix if characters are hex-like
-            try:
-                return "0x" + bytes.fromhex(raw_str).hex()
-            except ValueError:
-                return raw_str
+        # int(x, 0) rejects leading zeros, so those fall through to hex.
+        if raw_str.isdecimal() and (raw_str == "0" or raw_str[0] != "0"):
+            return hex(int(raw_str))
+        # Fallback: treat as hex without prefix if characters are hex-like
+        if len(raw_str) % 2 == 0 and _HEX_DIGITS.fullmatch(raw_str):
+            return "0x" + raw_str.lower()
+        return raw_str
     return str(raw)
 
 
+SEER_MARKET_URL = "https://app.seer.pm/markets/100/"
+_SEER_LINK_TEMPLATE = 'Seer: <a href="{seer}">Interact with the Market</a>\n'
+_NOTIFY_TEMPLATE = (
+    "<b>🔵🔵 NEW VERIFICATION REQUEST 🔵🔵</b>\n\n"
+    "A new market has been submitted for verification.\n\n"
+    "Market: <b>{name}</b>\n\n"
+    + _SEER_LINK_TEMPLATE
+    + 'Curate: <a href="{curate}">Check Market Compliance</a>\n\n'
+    "<i>💰Each market verification request comes with a $100 bounty. "
+    "Spot a case of non-compliance, submit a challenge, and if you win, the bounty is yours.💰</i>"
+)
+_DISPUTE_TEMPLATE = (
+    "<b>❗️❗️ DISPUTED MARKET ❗️❗️</b>\n\n"
+    "A market has been challenged.\n\n"
+    "Market: <b>{name}</b>\n\n"
+    "{seer_line}"
+    'Curate: <a href="{curate}">Follow the Dispute</a>'
+)
+
+
 def build_notification_message(
     event_name: str | None,
     args: Any,
-    contract_address: str,
+    curate_prefix: str,
     *,
     market_address_override: str | None = None,
     market_name: str | None = None,
+    item_id: str | None = None,
 ) -> str | None:
-    if event_name not in {"NewItem", "RequestSubmitted"}:
+    if event_name not in _NOTIFY_EVENTS:
         return None
-    args_dict = ensure_args_dict(args)
-    item_id = extract_item_id(args_dict)
+    if item_id is None:
+        item_id = extract_item_id(ensure_args_dict(args))
     if not item_id:
         logging.warning("Skipping notification; could not extract item ID.")
         return None
     target_id = market_address_override or item_id
-    display_name = market_name or target_id
-    checksum_contract = Web3.to_checksum_address(contract_address)
-    seer_url = f"https://app.seer.pm/markets/100/{target_id}"
-    curate_url = f"https://curate.kleros.io/tcr/100/{checksum_contract}/{item_id}"
-    return (
-        "<b>🔵🔵 NEW VERIFICATION REQUEST 🔵🔵</b>\n\n"
-        "A new market has been submitted for verification.\n\n"
-        f"Market: <b>{html.escape(display_name)}</b>\n\n"
-        f'Seer: <a href="{seer_url}">Interact with the Market</a>\n'
-        f'Curate: <a href="{curate_url}">Check Market Compliance</a>\n\n'
-        "<i>💰Each market verification request comes with a $100 bounty. "
-        "Spot a case of non-compliance, submit a challenge, and if you win, the bounty is yours.💰</i>"
+    return _NOTIFY_TEMPLATE.format_map(
+        {
+            "name": html.escape(market_name or target_id),
+            "seer": f"{SEER_MARKET_URL}{target_id}",
+            "curate": f"{curate_prefix}{item_id}",
+        }
     )
 
 
 def build_dispute_message(
-    item_id: str, contract_address: str, market_details: MarketDetails
+    item_id: str, curate_prefix: str, market_details: MarketDetails
 ) -> str:
-    display_name = market_details.name or item_id
-    checksum_contract = Web3.to_checksum_address(contract_address)
-    curate_url = f"https://curate.kleros.io/tcr/100/{checksum_contract}/{item_id}"
     seer_line = ""
     if market_details.address:
-        seer_url = f"https://app.seer.pm/markets/100/{market_details.address}"
-        seer_line = f'Seer: <a href="{seer_url}">Interact with the Market</a>\n'
-    return (
-        "<b>❗️❗️ DISPUTED MARKET ❗️❗️</b>\n\n"
-        "A market has been challenged.\n\n"
-        f"Market: <b>{html.escape(display_name)}</b>\n\n"
-        f"{seer_line}"
-        f'Curate: <a href="{curate_url}">Follow the Dispute</a>'
+        seer_line = _SEER_LINK_TEMPLATE.format(
+            seer=f"{SEER_MARKET_URL}{market_details.address}"
+        )
+    return _DISPUTE_TEMPLATE.format_map(
+        {
+            "name": html.escape(market_details.name or item_id),
+            "seer_line": seer_line,
+            "curate": f"{curate_prefix}{item_id}",
+        }
     )
 
 
-def build_ipfs_url(ipfs_path: str, gateway: str = IPFS_GATEWAY) -> str | None:
-    path = ipfs_path.strip()
-    if not path:
-        return None
-    if path.startswith("ipfs://"):
-        path = path[len("ipfs://") :]
-    if path.startswith("/ipfs/"):
-        path = path[len("/ipfs/") :]
-    if path.startswith("/"):
-        path = path[1:]
-    if not path:
-        return None
-    return f"{gateway.rstrip('/')}/ipfs/{path}"
+def build_ipfs_url(ipfs_path: str) -> str | None:
+    path = ipfs_path.strip().removeprefix("ipfs://").removeprefix("/ipfs/").lstrip("/")
+    return f"{_IPFS_GATEWAY_ROOT}/ipfs/{path}" if path else None
 
 
 def fetch_ipfs_json(ipfs_path: str) -> Dict[str, Any] | None:
@@ -414,7 +932,7 @@ def fetch_ipfs_json(ipfs_path: str) -> Dict[str, Any] | None:
         logging.warning("IPFS path %s could not be normalized", ipfs_path)
         return None
     try:
-        response = requests.get(url, timeout=IPFS_TIMEOUT)
+        response = _IPFS_SESSION.get(url, timeout=IPFS_TIMEOUT)
     except Exception as exc:  # noqa: BLE001
         logging.warning("Failed to fetch IPFS content at %s: %s", url, exc)
         return None
@@ -427,7 +945,7 @@ def fetch_ipfs_json(ipfs_path: str) -> Dict[str, Any] | None:
         )
         return None
     try:
-        return response.json()
+        return json_loads(response.content)
     except ValueError:
         logging.warning("IPFS content at %s is not valid JSON", url)
         return None
@@ -445,9 +963,66 @@ MARKET_NAME_ABI = [
 ]
 
 
-def fetch_market_details(ipfs_path: str, w3: Web3) -> MarketDetails:
+# IPFS payloads are content-addressed and item/market links never change, so
+# lookups are kept for good. Only complete answers are stored, which lets a
+# transient gateway or RPC failure be retried on the next event.
+_MARKET_CACHE: Dict[str, MarketDetails] = {}
+_MARKET_NAME_CACHE: Dict[str, str] = {}
+_SUBGRAPH_CACHE: Dict[str, str] = {}
+_market_cache_writes = 0
+
+
+def load_market_cache() -> None:
+    if not MARKET_CACHE_FILE.exists():
+        return
+
+    try:
+        with MARKET_CACHE_FILE.open("rb") as handle:
+            data = json_loads(handle.read())
+        for ipfs_path, (address, name) in data.get("markets", {}).items():
+            _MARKET_CACHE[ipfs_path] = MarketDetails(address=address, name=name)
+        _MARKET_NAME_CACHE.update(data.get("names", {}))
+        _SUBGRAPH_CACHE.update(data.get("subgraph", {}))
+    except (TypeError, ValueError):
+        logging.warning("Market cache corrupted, starting with an empty cache")
+
+
+def mark_market_cache_dirty() -> None:
+    global _market_cache_writes
+    _market_cache_writes += 1
+    if _market_cache_writes >= MARKET_CACHE_FLUSH_WRITES:
+        flush_market_cache()
+
+
+def flush_market_cache() -> None:
+    global _market_cache_writes
+    if not _market_cache_writes:
+        return
+    tmp_file = MARKET_CACHE_FILE.with_name(f"{MARKET_CACHE_FILE.name}.tmp")
+    cache = {
+        "markets": {
+            ipfs_path: [details.address, details.name]
+            for ipfs_path, details in _MARKET_CACHE.items()
+        },
+        "names": _MARKET_NAME_CACHE,
+        "subgraph": _SUBGRAPH_CACHE,
+    }
+    tmp_file.write_bytes(json_dumps(cache))
+    os.replace(tmp_file, MARKET_CACHE_FILE)
+    _market_cache_writes = 0
+
+
+atexit.register(flush_market_cache)
+
+
+async def fetch_market_details(ipfs_path: str, w3: AsyncWeb3) -> MarketDetails:
+    cached = _MARKET_CACHE.get(ipfs_path)
+    if cached is not None:
+        # Callers may fill in fields, so never hand out the cached instance.
+        return replace(cached)
+
     details = MarketDetails(address=None, name=None)
-    payload = fetch_ipfs_json(ipfs_path)
+    payload = await asyncio.to_thread(fetch_ipfs_json, ipfs_path)
     if payload is None:
         return details
 
@@ -474,27 +1049,28 @@ def fetch_market_details(ipfs_path: str, w3: Web3) -> MarketDetails:
         logging.warning("No valid market address found in IPFS payload for %s", ipfs_path)
 
     if details.address:
-        try:
-            contract = w3.eth.contract(address=details.address, abi=MARKET_NAME_ABI)
-            details.name = contract.functions.marketName().call()
-        except Exception as exc:  # noqa: BLE001
-            logging.warning(
-                "Could not fetch marketName from %s: %s",
-                details.address,
-                exc,
-            )
+        details.name = await fetch_market_name(details.address, w3)
+        if details.name is None:
+            return details
 
-    cache[ipfs_path] = details
+    _MARKET_CACHE[ipfs_path] = replace(details)
+    mark_market_cache_dirty()
     return details
 
 
-def fetch_market_name(address: str, w3: Web3) -> str | None:
+async def fetch_market_name(address: str, w3: AsyncWeb3) -> str | None:
+    cached = _MARKET_NAME_CACHE.get(address)
+    if cached is not None:
+        return cached
     try:
         contract = w3.eth.contract(address=address, abi=MARKET_NAME_ABI)
-        return contract.functions.marketName().call()
+        name = await contract.functions.marketName().call()
     except Exception as exc:  # noqa: BLE001
         logging.warning("Could not fetch marketName from %s: %s", address, exc)
         return None
+    _MARKET_NAME_CACHE[address] = name
+    mark_market_cache_dirty()
+    return name
 
 
 def fetch_market_from_subgraph(
@@ -502,6 +1078,10 @@ def fetch_market_from_subgraph(
 ) -> MarketDetails:
     if not SUBGRAPH_URL:
         return MarketDetails(address=None, name=None)
+    cache_key = f"{registry_address.lower()}/{item_id.lower()}"
+    cached = _SUBGRAPH_CACHE.get(cache_key)
+    if cached is not None:
+        return MarketDetails(address=cached, name=None)
     query = """
     query ($registry: String!, $item: String!) {
       LItem(
@@ -523,9 +1103,9 @@ def fetch_market_from_subgraph(
         },
     }
     try:
-        response = requests.post(SUBGRAPH_URL, json=payload, timeout=20)
+        response = _SUBGRAPH_SESSION.post(SUBGRAPH_URL, json=payload, timeout=20)
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
     except Exception as exc:  # noqa: BLE001
         logging.warning("Subgraph request failed: %s", exc)
         return MarketDetails(address=None, name=None)
@@ -535,24 +1115,63 @@ def fetch_market_from_subgraph(
             addr = items[0].get("key0")
             checksum = try_checksum_address(addr)
             if checksum:
+                _SUBGRAPH_CACHE[cache_key] = checksum
+                mark_market_cache_dirty()
                 return MarketDetails(address=checksum, name=None)
     except Exception as exc:  # noqa: BLE001
         logging.warning("Unexpected subgraph payload: %s", exc)
     return MarketDetails(address=None, name=None)
 
 
-def run() -> None:
+async def run() -> None:
     logging.basicConfig(
         level=os.getenv("LOG_LEVEL", "INFO"),
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
     settings = load_settings()
-    contract = build_contract(settings)
+    # Cancel the main task on SIGTERM (e.g. docker stop) so shutdown unwinds
+    # through normal cancellation and the atexit hooks then flush state.
+    main_task = asyncio.current_task()
+    if main_task is not None:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, main_task.cancel
+        )
+    notify_queue: asyncio.Queue[Notification | int] = asyncio.Queue(
+        maxsize=NOTIFY_QUEUE_SIZE
+    )
+    async with aiohttp.ClientSession(raise_for_status=True) as rpc_session:
+        tasks = {
+            asyncio.create_task(watch(settings, rpc_session, notify_queue)),
+            asyncio.create_task(notifier_worker(settings, notify_queue)),
+        }
+        try:
+            # Both loop forever, so whichever finishes first has failed; stop
+            # the other rather than let the watcher block on a dead queue.
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+            raise RuntimeError("Watcher or notifier stopped unexpectedly")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def watch(
+    settings: Settings,
+    rpc_session: aiohttp.ClientSession,
+    notify_queue: asyncio.Queue[Notification | int],
+) -> None:
+    contract = await build_contract(settings, rpc_session)
     event_classes = get_event_classes(contract)
+    topic_map = build_topic_map(event_classes)
+    curate_prefix = f"{CURATE_TCR_URL}/{Web3.to_checksum_address(contract.address)}/"
+    batch_sizer = BatchSizer(size=settings.batch_size)
+    poll_pacer = PollPacer(interval=settings.poll_interval)
 
-    current_chat_id = settings.telegram_chat_id
-    last_processed = determine_initial_block(contract, settings)
+    last_processed = await determine_initial_block(contract, settings)
+    set_checkpoint_baseline(last_processed)
 
     logging.info(
         "Watching %d events on contract %s",
@@ -560,100 +1179,146 @@ def run() -> None:
         normalise_value(contract.address),
     )
 
-    seen_transactions: Set[str] = set()
-    evidence_item_map: Dict[str, str] = {}
-    tx_item_map: Dict[str, str] = {}
+    load_seen_transactions()
+    load_market_cache()
+    evidence_item_map: OrderedDict[str, str] = OrderedDict()
+    tx_item_map: OrderedDict[bytes, str] = OrderedDict()
 
-    while True:
-        latest_block = contract.web3.eth.block_number
+    # The level is fixed at startup, so check it once rather than per event.
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+    # Consecutive failures of a single-block range, counted towards skipping it.
+    block_failures = 0
+
+    async for latest_block in iter_chain_heads(settings, contract.web3, poll_pacer):
         target_block = max(latest_block - settings.confirmations, 0)
 
         if last_processed >= target_block:
-            time.sleep(settings.poll_interval)
+            poll_pacer.record(0)
             continue
 
         window_start = last_processed + 1
+        window_events = 0
         for batch_start, batch_end in split_batches(
-            window_start, target_block, settings.batch_size
+            window_start, target_block, batch_sizer
         ):
             logging.info("Querying blocks %s-%s", batch_start, batch_end)
-            events = poll_for_events(contract, event_classes, batch_start, batch_end)
+            try:
+                events = await poll_for_events(
+                    contract, topic_map, batch_start, batch_end, batch_sizer
+                )
+            except Exception as exc:  # noqa: BLE001
+                if is_transient_rpc_error(exc):
+                    # An outage says nothing about the range itself: keep it
+                    # whole and let the next head retry it.
+                    logging.exception(
+                        "Failed to fetch events for blocks %s-%s; retrying on "
+                        "the next head: %s",
+                        batch_start,
+                        batch_end,
+                        exc,
+                    )
+                    break
+                # A range that keeps failing is halved down to one block, and a
+                # block that still fails is skipped so it can't stall the bot.
+                if batch_start < batch_end:
+                    batch_sizer.shrink(batch_end - batch_start + 1)
+                    block_failures = 0
+                else:
+                    block_failures += 1
+                if block_failures < BLOCK_FAILURE_LIMIT:
+                    logging.exception(
+                        "Failed to fetch events for blocks %s-%s; retrying in "
+                        "batches of up to %s on the next head: %s",
+                        batch_start,
+                        batch_end,
+                        batch_sizer.size,
+                        exc,
+                    )
+                    break
+                logging.error(
+                    "Skipping block %s after %s failed attempts: %s",
+                    batch_start,
+                    block_failures,
+                    exc,
+                )
+                block_failures = 0
+                last_processed = batch_end
+                await notify_queue.put(batch_end)
+                continue
+            block_failures = 0
+            batch_sizer.record(batch_end - batch_start + 1, len(events))
+            window_events += len(events)
+            # A tx lives in one block, so sibling events (NewItem and
+            # RequestSubmitted) always share a batch; this catches them while
+            # the first is still waiting in the queue.
+            queued_transactions: Set[bytes] = set()
             for event in events:
                 try:
+                    # HexBytes hashes like bytes, so the raw hash is the map key;
+                    # the hex string is only needed for log lines.
+                    tx_key: bytes | None = event.get("transactionHash") or None
                     tx_hash = (
-                        event["transactionHash"].hex()
-                        if event.get("transactionHash")
-                        else "<unknown>"
-                    )
-                    raw_emitter = event.get("address")
-                    emitter = (
-                        normalise_value(raw_emitter)
-                        if raw_emitter is not None
-                        else "<unknown>"
+                        "0x" + bytes.hex(tx_key) if tx_key is not None else "<unknown>"
                     )
+                    event_name = event.get("event")
+                    block_number = event.get("blockNumber")
                     args_dict = ensure_args_dict(event.get("args", {}))
-                    ipfs_path = args_dict.get("_data") or args_dict.get("data")
-                    market_details = (
-                        fetch_market_details(str(ipfs_path), contract.web3)
-                        if ipfs_path is not None
-                        else MarketDetails(address=None, name=None)
-                    )
+                    evidence_group = args_dict.get("_evidenceGroupID")
+                    # Every event with an item ID feeds the Dispute lookups (a
+                    # challenge tx also emits ItemStatusChange), so map them
+                    # before filtering; the network lookups come after it.
                     item_id = extract_item_id(args_dict) if args_dict else None
-                    if item_id and tx_hash != "<unknown>":
-                        tx_item_map[tx_hash] = item_id
-                    if item_id:
-                        if not market_details.address and SUBGRAPH_URL:
-                            subgraph_details = fetch_market_from_subgraph(
-                                item_id, contract.address
-                            )
-                            if subgraph_details.address:
-                                if not subgraph_details.name:
-                                    subgraph_details.name = fetch_market_name(
-                                        subgraph_details.address, contract.web3
-                                    )
-                                market_details = subgraph_details
-                        evidence_group = args_dict.get("_evidenceGroupID")
-                        if evidence_group is not None:
-                            evidence_item_map[str(evidence_group)] = item_id
-                    formatted_args = {
-                        key: normalise_value(val) for key, val in args_dict.items()
-                    }
+                    if item_id and tx_key is not None:
+                        remember_item(tx_item_map, tx_key, item_id)
+                    if item_id and evidence_group is not None:
+                        remember_item(evidence_item_map, str(evidence_group), item_id)
                     logging.info(
-                        "Detected event %s | block=%s | tx=%s | address=%s | args=%s",
-                        event.get("event"),
-                        event.get("blockNumber"),
+                        "Detected event %s | block=%s | tx=%s",
+                        event_name,
+                        block_number,
                         tx_hash,
-                        emitter,
-                        formatted_args,
                     )
+                    if debug_enabled:
+                        raw_emitter = event.get("address")
+                        emitter = (
+                            normalise_value(raw_emitter)
+                            if raw_emitter is not None
+                            else "<unknown>"
+                        )
+                        formatted_args = {
+                            key: normalise_value(val) for key, val in args_dict.items()
+                        }
+                        logging.debug(
+                            "Event details | tx=%s | address=%s | args=%s",
+                            tx_hash,
+                            emitter,
+                            formatted_args,
+                        )
 
-                    if event.get("event") not in {"NewItem", "RequestSubmitted", "Dispute"}:
+                    if event_name not in _HANDLED_EVENTS:
                         continue
 
-                    if event.get("event") != "Dispute" and tx_hash != "<unknown>" and tx_hash in seen_transactions:
+                    if event_name != "Dispute" and tx_key is not None and (
+                        tx_key in _seen_transactions or tx_key in queued_transactions
+                    ):
                         logging.info(
                             "Skipping duplicate notification for tx=%s", tx_hash
                         )
                         continue
 
                     message: str | None
-                    if event.get("event") == "Dispute":
-                        evidence_group = args_dict.get("_evidenceGroupID")
-                        linked_item = evidence_item_map.get(str(evidence_group)) or tx_item_map.get(tx_hash)
+                    if event_name == "Dispute":
+                        linked_item = evidence_item_map.get(str(evidence_group)) or tx_item_map.get(tx_key)
                         linked_details = MarketDetails(None, None)
                         if linked_item:
-                            subgraph_details = fetch_market_from_subgraph(
-                                linked_item, contract.address
+                            subgraph_details = await asyncio.to_thread(
+                                fetch_market_from_subgraph, linked_item, contract.address
                             )
                             if subgraph_details.address and not subgraph_details.name:
-                                subgraph_details.name = fetch_market_name(
+                                subgraph_details.name = await fetch_market_name(
                                     subgraph_details.address, contract.web3
                                 )
                             linked_details = subgraph_details
-                            if linked_details.address and not linked_details.name:
-                                linked_details.name = fetch_market_name(
-                                    linked_details.address, contract.web3
-                                )
                         if not linked_item:
                             logging.warning(
                                 "Dispute without known item ID (evidenceGroupID=%s)",
@@ -661,45 +1326,57 @@ def run() -> None:
                             )
                             continue
                         message = build_dispute_message(
-                            linked_item, contract.address, linked_details
+                            linked_item, curate_prefix, linked_details
                         )
                     else:
+                        ipfs_path = args_dict.get("_data") or args_dict.get("data")
+                        market_details = (
+                            await fetch_market_details(str(ipfs_path), contract.web3)
+                            if ipfs_path is not None
+                            else MarketDetails(address=None, name=None)
+                        )
+                        if item_id and not market_details.address and SUBGRAPH_URL:
+                            subgraph_details = await asyncio.to_thread(
+                                fetch_market_from_subgraph, item_id, contract.address
+                            )
+                            if subgraph_details.address:
+                                if not subgraph_details.name:
+                                    subgraph_details.name = await fetch_market_name(
+                                        subgraph_details.address, contract.web3
+                                    )
+                                market_details = subgraph_details
                         message = build_notification_message(
-                            event.get("event"),
+                            event_name,
                             args_dict,
-                            contract.address,
+                            curate_prefix,
                             market_address_override=market_details.address,
                             market_name=market_details.name,
+                            item_id=item_id,
                         )
                     if message:
-                        delivered_chat_id = deliver_notification(
-                            settings.telegram_token,
-                            current_chat_id,
-                            message,
-                            parse_mode="HTML",
-                            disable_preview=False,
-                        )
-                        current_chat_id = delivered_chat_id
-                        settings.telegram_chat_id = delivered_chat_id
-                        if tx_hash != "<unknown>":
-                            seen_transactions.add(tx_hash)
-                        logging.info(
-                            "Sent notification for %s (block %s) | tx=%s",
-                            event["event"],
-                            event["blockNumber"],
-                            tx_hash,
+                        if tx_key is not None:
+                            queued_transactions.add(tx_key)
+                        await notify_queue.put(
+                            Notification(
+                                message,
+                                event_name,
+                                block_number,
+                                tx_hash,
+                                tx_key,
+                            )
                         )
                 except Exception as exc:  # noqa: BLE001
-                    logging.exception("Failed to send notification: %s", exc)
+                    logging.exception("Failed to prepare notification: %s", exc)
             last_processed = batch_end
-            save_last_processed_block(last_processed)
-
-        time.sleep(settings.poll_interval)
-
+            # The notifier persists this once the batch's messages are out.
+            await notify_queue.put(batch_end)
+        # The whole backlog up to the head is drained above, so catching up
+        # never waits on the poll delay; only the next head lookup does.
+        poll_pacer.record(window_events)
 
 
 if __name__ == "__main__":
     try:
-        run()
-    except KeyboardInterrupt:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logging.info("Shutting down watcher.")